@@ -1 +1,40 @@
 # AgentLang council agents package
+
+from __future__ import annotations
+
+from typing import Callable
+
+from agents.base_agent import BaseAgent
+
+# Each agent module imports its provider SDK (10–100 ms and sizeable RSS), so the
+# classes are imported on first lookup rather than when this package loads.
+
+
+def _anthropic() -> type[BaseAgent]:
+    from agents.anthropic_agent import AnthropicAgent
+    return AnthropicAgent
+
+
+def _openai() -> type[BaseAgent]:
+    from agents.openai_agent import OpenAIAgent
+    return OpenAIAgent
+
+
+def _google() -> type[BaseAgent]:
+    from agents.google_agent import GoogleAgent
+    return GoogleAgent
+
+
+def _xai() -> type[BaseAgent]:
+    from agents.xai_agent import XAIAgent
+    return XAIAgent
+
+
+# Maps config.AGENTS "agent_class" values to loaders for their implementations.
+# Phase 2/3 agents are added here as their modules land.
+REGISTRY: dict[str, Callable[[], type[BaseAgent]]] = {
+    "anthropic_agent.AnthropicAgent": _anthropic,
+    "openai_agent.OpenAIAgent": _openai,
+    "google_agent.GoogleAgent": _google,
+    "xai_agent.XAIAgent": _xai,
+}
@@ -11,9 +11,19 @@ from agents.base_agent import BaseAgent
 
 
 class AnthropicAgent(BaseAgent):
+    __slots__ = ("_client",)
+
+    transient_errors = (
+        anthropic.APIConnectionError,  # includes APITimeoutError
+        anthropic.RateLimitError,
+        anthropic.InternalServerError,
+    )
+
     async def _call_api(self, system_prompt: str, user_prompt: str) -> str:
-        client = anthropic.AsyncAnthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
-        message = await client.messages.create(
+        # Reuse one client (and its connection pool) across retries
+        if not hasattr(self, "_client"):
+            self._client = anthropic.AsyncAnthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
+        message = await self._client.messages.create(
             model=self.model,
             max_tokens=1024,
             system=system_prompt,
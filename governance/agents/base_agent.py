@@ -9,12 +9,16 @@ import random
 import re
 from abc import ABC, abstractmethod
 
+import response_cache
+
 MAX_RETRIES = 3
 RETRY_BASE_DELAY = 2.0  # seconds; doubles each attempt (2s, 4s, 8s) plus jitter
 
 VOTE_LINE_RE = re.compile(r"^VOTE:\s*(APPROVE|REJECT|ABSTAIN)", re.IGNORECASE)
 REASONING_RE = re.compile(r"REASONING:\s*(.+)", re.DOTALL | re.IGNORECASE)
 
+VOTE_VALUES = frozenset({"APPROVE", "REJECT", "ABSTAIN"})
+
 
 class BaseAgent(ABC):
     """
@@ -22,6 +26,12 @@ class BaseAgent(ABC):
     `vote()` is the public interface used by the orchestrator.
     """
 
+    __slots__ = ("config", "agent_name", "company", "model")
+
+    # Errors worth retrying. Subclasses narrow this to their SDK's transient errors
+    # (connection, rate limit, 5xx) so auth and bad-request failures fail fast.
+    transient_errors: tuple[type[Exception], ...] = (Exception,)
+
     def __init__(self, config: dict):
         self.config = config
         self.agent_name: str = config["name"]
@@ -37,13 +47,19 @@ class BaseAgent(ABC):
         Returns (vote_value, reasoning) where vote_value is APPROVE/REJECT/ABSTAIN.
         Retries up to MAX_RETRIES times with exponential backoff on transient errors.
         Raises on the final failure (caller handles as ERROR).
+        Successful raw responses are cached on disk, so re-runs on an identical PR are free.
         """
+        key = response_cache.make_key(self.model, system_prompt, user_prompt)
         last_exc: Exception
         for attempt in range(MAX_RETRIES):
             try:
-                raw = await self._call_api(system_prompt, user_prompt)
+                raw = await response_cache.get_or_call(
+                    key,
+                    lambda: self._call_api(system_prompt, user_prompt),
+                    model=self.model,
+                )
                 return self.parse_vote(raw)
-            except Exception as exc:
+            except self.transient_errors as exc:
                 last_exc = exc
                 if attempt < MAX_RETRIES - 1:
                     delay = RETRY_BASE_DELAY * (2 ** attempt) + random.uniform(0, 1)
@@ -58,6 +74,18 @@ class BaseAgent(ABC):
           VOTE: APPROVE|REJECT|ABSTAIN
           REASONING: ...
         """
+        # Fast path for the documented format: plain string checks, no regex engine
+        head, _, rest = raw.lstrip().partition("\n")
+        if head[:5].upper() == "VOTE:":
+            vote = head[5:].strip().upper()
+            rest = rest.lstrip()
+            if vote in VOTE_VALUES and rest[:10].upper() == "REASONING:":
+                reasoning = rest[10:].strip()
+                # An empty REASONING falls through so the raw text is kept, as below
+                if reasoning:
+                    return vote, reasoning
+
+        # Malformed response: look for each field independently
         raw = raw.strip()
         vote_match = VOTE_LINE_RE.search(raw)
         vote = vote_match.group(1).upper() if vote_match else "ABSTAIN"
@@ -6,22 +6,34 @@ from __future__ import annotations
 
 import os
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 
 from agents.base_agent import BaseAgent
 
 
 class GoogleAgent(BaseAgent):
-    async def _call_api(self, system_prompt: str, user_prompt: str) -> str:
+    __slots__ = ("_models",)
+
+    transient_errors = (
+        google_exceptions.DeadlineExceeded,
+        google_exceptions.ResourceExhausted,
+        google_exceptions.InternalServerError,
+        google_exceptions.ServiceUnavailable,
+    )
+
+    def __init__(self, config: dict):
+        super().__init__(config)
         genai.configure(api_key=os.environ["GOOGLE_API_KEY"])
-        model = genai.GenerativeModel(
-            model_name=self.model,
-            system_instruction=system_prompt,
-        )
-        # google-generativeai doesn't have a native async client; run synchronously
-        import asyncio
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: model.generate_content(user_prompt),
-        )
+        # system_instruction is baked into each GenerativeModel, so cache per prompt
+        self._models: dict[tuple[str, str], genai.GenerativeModel] = {}
+
+    async def _call_api(self, system_prompt: str, user_prompt: str) -> str:
+        key = (self.model, system_prompt)
+        model = self._models.get(key)
+        if model is None:
+            model = self._models[key] = genai.GenerativeModel(
+                model_name=self.model,
+                system_instruction=system_prompt,
+            )
+        response = await model.generate_content_async(user_prompt)
         return response.text
@@ -5,21 +5,31 @@ OpenAI (GPT-4o) council agent.
 from __future__ import annotations
 
 import os
+import openai
 from openai import AsyncOpenAI
 
 from agents.base_agent import BaseAgent
 
 
 class OpenAIAgent(BaseAgent):
+    __slots__ = ("_client",)
+
     base_url: str | None = None  # Override in subclasses (e.g. xAI, DeepSeek)
+    transient_errors = (
+        openai.APIConnectionError,  # includes APITimeoutError
+        openai.RateLimitError,
+        openai.InternalServerError,
+    )
 
     async def _call_api(self, system_prompt: str, user_prompt: str) -> str:
-        kwargs: dict = {"api_key": os.environ[self.config["api_key_env"]]}
-        if self.base_url:
-            kwargs["base_url"] = self.base_url
+        # Reuse one client (and its connection pool) across retries
+        if not hasattr(self, "_client"):
+            kwargs: dict = {"api_key": os.environ[self.config["api_key_env"]]}
+            if self.base_url:
+                kwargs["base_url"] = self.base_url
+            self._client = AsyncOpenAI(**kwargs)
 
-        client = AsyncOpenAI(**kwargs)
-        response = await client.chat.completions.create(
+        response = await self._client.chat.completions.create(
             model=self.model,
             max_tokens=1024,
             messages=[
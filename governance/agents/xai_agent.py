@@ -9,4 +9,5 @@ from agents.openai_agent import OpenAIAgent
 
 
 class XAIAgent(OpenAIAgent):
+    __slots__ = ()
     base_url = "https://api.x.ai/v1"
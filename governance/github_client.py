@@ -5,46 +5,256 @@ Uses only httpx + the GITHUB_TOKEN provided by GitHub Actions.
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import functools
+import inspect
 import os
+import random
+import time
+
 import httpx
+import orjson
 
 GITHUB_API = "https://api.github.com"
-_TOKEN = os.environ.get("GITHUB_TOKEN", "")
-_HEADERS = {
-    "Authorization": f"Bearer {_TOKEN}",
-    "Accept": "application/vnd.github+json",
-    "X-GitHub-Api-Version": "2022-11-28",
-}
+_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+
+# One pooled client per process so every call reuses the same TLS connection(s)
+_CLIENT = httpx.Client(timeout=30, http2=True, limits=_LIMITS)
+atexit.register(_CLIENT.close)
+
+# The async client is created lazily inside the running event loop; see aclose()
+_ACLIENT: httpx.AsyncClient | None = None
+
+# PR comment listings fetched during this run, keyed by (repo, pr_number).
+# Writes below keep them current so each PR is paginated at most once per process.
+_comments_cache: dict[tuple[str, int], list[dict]] = {}
+
+# Caps concurrent comment writes to stay clear of GitHub's secondary rate limits
+_WRITE_SEMAPHORE = asyncio.Semaphore(5)
+
+RETRY_STATUSES = (429, 502, 503, 504)
+MAX_RETRY_DELAY = 60.0  # seconds; never wait longer than this for a rate-limit reset
+
+
+@functools.lru_cache(maxsize=1)
+def _headers_for_token(token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+
+
+def _headers(extra: dict[str, str] | None = None) -> dict[str, str]:
+    """
+    Request headers for the current GITHUB_TOKEN.
+    Read per call rather than at import, so a token set after import is still used.
+    """
+    headers = _headers_for_token(os.environ.get("GITHUB_TOKEN", ""))
+    return {**headers, **extra} if extra else headers
+
+
+def _aclient() -> httpx.AsyncClient:
+    global _ACLIENT
+    if _ACLIENT is None:
+        _ACLIENT = httpx.AsyncClient(timeout=30, http2=True, limits=_LIMITS)
+    return _ACLIENT
 
 
-def _get(url: str, **kwargs) -> httpx.Response:
-    return httpx.get(url, headers=_HEADERS, timeout=30, **kwargs)
+async def aclose() -> None:
+    """Close the async client. Call before the event loop shuts down."""
+    global _ACLIENT
+    if _ACLIENT is not None:
+        await _ACLIENT.aclose()
+        _ACLIENT = None
+
+
+def _is_rate_limited(resp: httpx.Response) -> bool:
+    if resp.status_code == 429:
+        return True
+    # Secondary rate limits come back as 403 with Retry-After or an exhausted quota
+    return resp.status_code == 403 and (
+        "Retry-After" in resp.headers or resp.headers.get("x-ratelimit-remaining") == "0"
+    )
 
 
+def _is_retryable(resp: httpx.Response) -> bool:
+    return resp.status_code in RETRY_STATUSES or _is_rate_limited(resp)
+
+
+def _retry_delay(resp: httpx.Response | None, attempt: int) -> float:
+    """Honor Retry-After / x-ratelimit-reset when present, else back off exponentially."""
+    delay = float(2 ** attempt)
+    if resp is not None:
+        retry_after = resp.headers.get("Retry-After")
+        reset = resp.headers.get("x-ratelimit-reset")
+        try:
+            if retry_after:
+                delay = float(retry_after)
+            elif reset and resp.headers.get("x-ratelimit-remaining") == "0":
+                delay = max(0.0, float(reset) - time.time())
+        except ValueError:
+            pass
+    return min(delay, MAX_RETRY_DELAY) + random.uniform(0, 1)
+
+
+def _with_retry(max_attempts: int = 4, idempotent: bool = True):
+    """
+    Retry a request helper on 429/5xx gateway errors, secondary rate limits, and
+    transport errors. The final response is returned as-is for the caller to check.
+    Works for both the sync and async helpers.
+    Non-idempotent helpers only retry when the request was certainly not applied:
+    rate-limit rejections and connection failures. A 5xx gateway error or a lost
+    response may follow a write that succeeded, so those are not retried.
+    """
+    retry_errors = httpx.TransportError if idempotent else (httpx.ConnectError, httpx.ConnectTimeout)
+    retryable = _is_retryable if idempotent else _is_rate_limited
+
+    def decorator(fn):
+        def _should_retry(attempt: int, resp: httpx.Response | None, exc: Exception | None) -> float | None:
+            if attempt == max_attempts - 1 or (resp is not None and not retryable(resp)):
+                return None
+            delay = _retry_delay(resp, attempt)
+            reason = exc if exc is not None else f"HTTP {resp.status_code}"
+            print(f"  GitHub API {fn.__name__}: {reason} — retrying in {delay:.1f}s "
+                  f"(attempt {attempt + 1}/{max_attempts})")
+            return delay
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                for attempt in range(max_attempts):
+                    try:
+                        resp = await fn(*args, **kwargs)
+                    except retry_errors as exc:
+                        delay = _should_retry(attempt, None, exc)
+                        if delay is None:
+                            raise
+                    else:
+                        delay = _should_retry(attempt, resp, None)
+                        if delay is None:
+                            return resp
+                        await resp.aclose()
+                    await asyncio.sleep(delay)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    resp = fn(*args, **kwargs)
+                except retry_errors as exc:
+                    delay = _should_retry(attempt, None, exc)
+                    if delay is None:
+                        raise
+                else:
+                    delay = _should_retry(attempt, resp, None)
+                    if delay is None:
+                        return resp
+                    # Release the connection of a streamed response before retrying
+                    resp.close()
+                time.sleep(delay)
+        return wrapper
+    return decorator
+
+
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+
+def _json(resp: httpx.Response):
+    """Decode a JSON response body with orjson (several times faster than stdlib json)."""
+    return orjson.loads(resp.content)
+
+
+@_with_retry()
+def _get(url: str, headers: dict[str, str] | None = None, **kwargs) -> httpx.Response:
+    return _CLIENT.get(url, headers=_headers(headers), **kwargs)
+
+
+@_with_retry(idempotent=False)
 def _post(url: str, json: dict) -> httpx.Response:
-    return httpx.post(url, headers=_HEADERS, json=json, timeout=30)
+    return _CLIENT.post(url, content=orjson.dumps(json), headers=_headers(_JSON_CONTENT_TYPE))
 
 
+@_with_retry()
 def _patch(url: str, json: dict) -> httpx.Response:
-    return httpx.patch(url, headers=_HEADERS, json=json, timeout=30)
+    return _CLIENT.patch(url, content=orjson.dumps(json), headers=_headers(_JSON_CONTENT_TYPE))
+
+
+@_with_retry()
+def _open_stream(url: str, headers: dict[str, str] | None = None, **kwargs) -> httpx.Response:
+    """Send a GET whose body is left unread; the caller must close the response."""
+    return _CLIENT.send(_CLIENT.build_request("GET", url, headers=_headers(headers), **kwargs), stream=True)
+
+
+@_with_retry()
+async def _aget(url: str, headers: dict[str, str] | None = None, **kwargs) -> httpx.Response:
+    return await _aclient().get(url, headers=_headers(headers), **kwargs)
+
+
+@_with_retry(idempotent=False)
+async def _apost(url: str, json: dict) -> httpx.Response:
+    return await _aclient().post(url, content=orjson.dumps(json), headers=_headers(_JSON_CONTENT_TYPE))
+
+
+@_with_retry()
+async def _apatch(url: str, json: dict) -> httpx.Response:
+    return await _aclient().patch(url, content=orjson.dumps(json), headers=_headers(_JSON_CONTENT_TYPE))
+
+
+def _remember_comment(repo: str, comment: dict, pr_number: int | None = None) -> None:
+    """Replace (by id) or append a freshly written comment in the cached listings."""
+    for (cached_repo, cached_pr), comments in _comments_cache.items():
+        if cached_repo != repo:
+            continue
+        for i, c in enumerate(comments):
+            if c.get("id") == comment.get("id"):
+                comments[i] = comment
+                return
+        if cached_pr == pr_number:
+            comments.append(comment)
+            return
+
+
+def _comments_url(repo: str, pr_number: int) -> str:
+    return f"{GITHUB_API}/repos/{repo}/issues/{pr_number}/comments"
+
+
+def _page_params(page: int) -> dict:
+    return {"per_page": 100, "page": page}
+
+
+def _add_comment_page(comments: list[dict], resp: httpx.Response) -> bool:
+    """Append one page of comments; return False once the listing is exhausted."""
+    resp.raise_for_status()
+    batch = _json(resp)
+    comments.extend(batch)
+    return bool(batch)
 
 
 def get_pr_comments(repo: str, pr_number: int) -> list[dict]:
-    """Fetch all issue comments on a PR (not review comments)."""
-    comments: list[dict] = []
-    page = 1
-    while True:
-        resp = _get(
-            f"{GITHUB_API}/repos/{repo}/issues/{pr_number}/comments",
-            params={"per_page": 100, "page": page},
-        )
-        resp.raise_for_status()
-        batch = resp.json()
-        if not batch:
-            break
-        comments.extend(batch)
-        page += 1
-    return comments
+    """Fetch all issue comments on a PR (not review comments). Cached per run."""
+    key = (repo, pr_number)
+    if key not in _comments_cache:
+        comments: list[dict] = []
+        page = 1
+        while _add_comment_page(comments, _get(_comments_url(repo, pr_number), params=_page_params(page))):
+            page += 1
+        _comments_cache[key] = comments
+    return _comments_cache[key]
+
+
+async def aget_pr_comments(repo: str, pr_number: int) -> list[dict]:
+    """Async variant of get_pr_comments (shares the same cache)."""
+    key = (repo, pr_number)
+    if key not in _comments_cache:
+        comments: list[dict] = []
+        page = 1
+        while _add_comment_page(comments, await _aget(_comments_url(repo, pr_number), params=_page_params(page))):
+            page += 1
+        _comments_cache[key] = comments
+    return _comments_cache[key]
 
 
 def find_comment_with_marker(comments: list[dict], marker: str) -> dict | None:
@@ -58,11 +268,13 @@ def find_comment_with_marker(comments: list[dict], marker: str) -> dict | None:
 def post_comment(repo: str, pr_number: int, body: str) -> dict:
     """Create a new issue comment on the PR."""
     resp = _post(
-        f"{GITHUB_API}/repos/{repo}/issues/{pr_number}/comments",
+        _comments_url(repo, pr_number),
         json={"body": body},
     )
     resp.raise_for_status()
-    return resp.json()
+    comment = _json(resp)
+    _remember_comment(repo, comment, pr_number)
+    return comment
 
 
 def update_comment(repo: str, comment_id: int, body: str) -> dict:
@@ -72,7 +284,9 @@ def update_comment(repo: str, comment_id: int, body: str) -> dict:
         json={"body": body},
     )
     resp.raise_for_status()
-    return resp.json()
+    comment = _json(resp)
+    _remember_comment(repo, comment)
+    return comment
 
 
 def upsert_comment(repo: str, pr_number: int, marker: str, body: str) -> dict:
@@ -87,6 +301,43 @@ def upsert_comment(repo: str, pr_number: int, marker: str, body: str) -> dict:
     return post_comment(repo, pr_number, body)
 
 
+async def aupdate_or_post(repo: str, pr_number: int, existing: dict | None, body: str) -> dict:
+    """Edit `existing` if given, else create a new comment on the PR."""
+    async with _WRITE_SEMAPHORE:
+        if existing:
+            resp = await _apatch(
+                f"{GITHUB_API}/repos/{repo}/issues/comments/{existing['id']}",
+                json={"body": body},
+            )
+        else:
+            resp = await _apost(
+                _comments_url(repo, pr_number),
+                json={"body": body},
+            )
+    resp.raise_for_status()
+    comment = _json(resp)
+    _remember_comment(repo, comment, pr_number)
+    return comment
+
+
+async def aupsert_comment(
+    repo: str,
+    pr_number: int,
+    marker: str,
+    body: str,
+    comments: list[dict] | None = None,
+) -> dict:
+    """
+    Async variant of upsert_comment.
+    Pass an already-fetched `comments` list to skip re-paginating the PR comments;
+    this lets several upserts run concurrently against one listing.
+    """
+    if comments is None:
+        comments = await aget_pr_comments(repo, pr_number)
+    existing = find_comment_with_marker(comments, marker)
+    return await aupdate_or_post(repo, pr_number, existing, body)
+
+
 def add_label(repo: str, pr_number: int, label: str) -> None:
     """Add a label to a PR (silently ignores errors if label doesn't exist)."""
     resp = _post(
@@ -98,23 +349,49 @@ def add_label(repo: str, pr_number: int, label: str) -> None:
         resp.raise_for_status()
 
 
-def get_pr_diff(repo: str, base_sha: str, head_sha: str) -> str:
-    """Fetch the unified diff for the PR via the compare API."""
-    resp = httpx.get(
+def get_pr_diff(repo: str, base_sha: str, head_sha: str, max_chars: int | None = None) -> str:
+    """
+    Fetch the unified diff for the PR via the compare API.
+    With max_chars, stop reading the response once that many characters have
+    arrived and return at most max_chars, so huge diffs are never fully downloaded.
+    """
+    resp = _open_stream(
         f"{GITHUB_API}/repos/{repo}/compare/{base_sha}...{head_sha}",
-        headers={**_HEADERS, "Accept": "application/vnd.github.v3.diff"},
+        headers={"Accept": "application/vnd.github.v3.diff"},
         timeout=60,
     )
-    resp.raise_for_status()
-    return resp.text
+    try:
+        resp.raise_for_status()
+        chunks: list[str] = []
+        total = 0
+        for chunk in resp.iter_text():
+            chunks.append(chunk)
+            total += len(chunk)
+            if max_chars is not None and total >= max_chars:
+                break
+    finally:
+        resp.close()
+    diff = "".join(chunks)
+    return diff if max_chars is None else diff[:max_chars]
 
 
-def get_changed_files(repo: str, base_sha: str, head_sha: str) -> list[str]:
-    """Return list of filenames changed in the PR."""
-    resp = _get(
-        f"{GITHUB_API}/repos/{repo}/compare/{base_sha}...{head_sha}",
-        params={"per_page": 300},
-    )
-    resp.raise_for_status()
-    data = resp.json()
-    return [f["filename"] for f in data.get("files", [])]
+def get_changed_files(repo: str, pr_number: int) -> list[str]:
+    """
+    Return list of filenames changed in the PR.
+    Uses the PR files endpoint, paginated at the API maximum of 100 per page;
+    the compare API lists at most 300 files and truncates silently beyond that.
+    """
+    files: list[str] = []
+    page = 1
+    while True:
+        resp = _get(
+            f"{GITHUB_API}/repos/{repo}/pulls/{pr_number}/files",
+            params={"per_page": 100, "page": page},
+        )
+        resp.raise_for_status()
+        batch = _json(resp)
+        files.extend(f["filename"] for f in batch)
+        if len(batch) < 100:
+            break
+        page += 1
+    return files
@@ -11,9 +11,10 @@ Usage:
 from __future__ import annotations
 
 import asyncio
-import importlib
+import json
 import os
 import sys
+import tempfile
 import traceback
 
 # Make governance/ importable as top-level (agents/ lives alongside this file)
@@ -21,6 +22,7 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 import config as cfg
 import github_client as gh
+from agents import REGISTRY
 from prompts import build_system_prompt, build_user_prompt
 from validator import validate_al_files, format_validation_status
 from vote_counter import (
@@ -28,6 +30,7 @@ from vote_counter import (
     tally,
     format_summary_comment,
     format_individual_vote_comment,
+    vote_comment_marker,
 )
 
 
@@ -45,14 +48,67 @@ HEAD_SHA     = _env("HEAD_SHA")
 REPO         = _env("REPO_FULL_NAME")
 
 
+# ─── Shared PR data ───────────────────────────────────────────────────────────
+
+_PREFETCH_PATH = os.path.join(tempfile.gettempdir(), f"agentlang_pr_{HEAD_SHA}.json")
+_prefetched: dict | None = None
+_diff: str | None = None
+
+
+def _prefetch_once() -> dict:
+    """
+    Fetch the PR's changed files once per head commit.
+    Memoized on disk so --flag-readme and --vote, which run as separate steps
+    of the same CI job, share a single files-API listing. The diff is not
+    fetched here; see _pr_diff.
+    """
+    global _prefetched
+    if _prefetched is not None:
+        return _prefetched
+
+    try:
+        with open(_PREFETCH_PATH, encoding="utf-8") as fh:
+            data = json.load(fh)
+        if data.get("base_sha") == BASE_SHA and data.get("head_sha") == HEAD_SHA:
+            _prefetched = data
+            return data
+    except (OSError, ValueError):
+        pass
+
+    data = {
+        "base_sha": BASE_SHA,
+        "head_sha": HEAD_SHA,
+        "changed_files": gh.get_changed_files(REPO, PR_NUMBER),
+    }
+    try:
+        with open(_PREFETCH_PATH, "w", encoding="utf-8") as fh:
+            json.dump(data, fh)
+    except OSError as exc:
+        print(f"Warning: could not memoize PR data to {_PREFETCH_PATH}: {exc}")
+    _prefetched = data
+    return data
+
+
+def _pr_diff() -> str:
+    """
+    Fetch the PR diff on first use. Only cmd_vote needs it, and only once the
+    README check has passed, so a README-only rejection never downloads it.
+    """
+    global _diff
+    if _diff is None:
+        # One character past the limit is enough to know the PR must be rejected
+        _diff = gh.get_pr_diff(REPO, BASE_SHA, HEAD_SHA, max_chars=cfg.MAX_DIFF_CHARS + 1)
+    return _diff
+
+
 # ─── Agent loader ─────────────────────────────────────────────────────────────
 
 def load_agent(agent_cfg: dict):
-    """Dynamically import and instantiate the agent class."""
-    module_name, class_name = agent_cfg["agent_class"].rsplit(".", 1)
-    module = importlib.import_module(f"agents.{module_name}")
-    cls = getattr(module, class_name)
-    return cls(agent_cfg)
+    """Look up the agent class in the static registry (importing its SDK) and instantiate it."""
+    loader = REGISTRY.get(agent_cfg["agent_class"])
+    if loader is None:
+        raise ValueError(f"Unknown agent_class {agent_cfg['agent_class']!r}")
+    return loader()(agent_cfg)
 
 
 # ─── Validate .al files ───────────────────────────────────────────────────────
@@ -93,7 +149,7 @@ def cmd_validate_only() -> int:
 
 def cmd_flag_readme() -> int:
     """If README.md is modified, ensure the summary will include the human-approval warning."""
-    changed_files = gh.get_changed_files(REPO, BASE_SHA, HEAD_SHA)
+    changed_files = _prefetch_once()["changed_files"]
     if "README.md" in changed_files:
         print("README.md detected in changed files — human approval warning will be included.")
     return 0
@@ -106,18 +162,6 @@ async def run_single_agent(agent_cfg: dict, system_prompt: str, user_prompt: str
     name    = agent_cfg["name"]
     company = agent_cfg["company"]
 
-    # Check API key presence
-    api_key_env = agent_cfg.get("api_key_env")
-    if api_key_env and not os.environ.get(api_key_env):
-        print(f"  [{name}] API key env {api_key_env!r} not set — skipping.")
-        return AgentVoteRecord(
-            agent_name=name,
-            company=company,
-            vote="ABSTAIN",
-            reasoning="",
-            error=f"API key `{api_key_env}` not configured.",
-        )
-
     try:
         agent = load_agent(agent_cfg)
         vote_value, reasoning = await asyncio.wait_for(
@@ -142,6 +186,23 @@ async def run_single_agent(agent_cfg: dict, system_prompt: str, user_prompt: str
         )
 
 
+def _has_api_key(agent_cfg: dict) -> bool:
+    api_key_env = agent_cfg.get("api_key_env")
+    return not api_key_env or bool(os.environ.get(api_key_env))
+
+
+def _build_unconfigured_record(agent_cfg: dict) -> AgentVoteRecord:
+    api_key_env = agent_cfg["api_key_env"]
+    print(f"  [{agent_cfg['name']}] API key env {api_key_env!r} not set — skipping.")
+    return AgentVoteRecord(
+        agent_name=agent_cfg["name"],
+        company=agent_cfg["company"],
+        vote="ABSTAIN",
+        reasoning="",
+        error=f"API key `{api_key_env}` not configured.",
+    )
+
+
 def _build_disabled_record(agent_cfg: dict) -> AgentVoteRecord:
     reason = agent_cfg.get("abstain_reason", "Not yet enabled")
     return AgentVoteRecord(
@@ -152,9 +213,19 @@ def _build_disabled_record(agent_cfg: dict) -> AgentVoteRecord:
     )
 
 
+async def _post_vote_comment(record: AgentVoteRecord, comments: list[dict]) -> None:
+    """Upsert one agent's vote comment; failures are logged, not raised."""
+    body = format_individual_vote_comment(record, PR_NUMBER)
+    try:
+        await gh.aupsert_comment(REPO, PR_NUMBER, vote_comment_marker(record.agent_name), body, comments)
+    except Exception as exc:
+        print(f"  Warning: could not post comment for {record.agent_name}: {exc}")
+
+
 async def cmd_vote() -> int:
     """Run the full council vote and post results. Return exit code."""
-    changed_files = gh.get_changed_files(REPO, BASE_SHA, HEAD_SHA)
+    pr_data = _prefetch_once()
+    changed_files = pr_data["changed_files"]
     has_readme = "README.md" in changed_files
     is_protected = any(f.startswith(cfg.PROTECTED_PREFIXES) for f in changed_files)
     threshold = cfg.SUPERMAJORITY_THRESHOLD if is_protected else cfg.APPROVAL_THRESHOLD
@@ -169,12 +240,11 @@ async def cmd_vote() -> int:
             "",
             "> Per governance rules, any pull request that changes `README.md` is automatically rejected.",
         ])
-        gh.upsert_comment(REPO, PR_NUMBER, cfg.SUMMARY_COMMENT_MARKER, body)
+        await gh.aupsert_comment(REPO, PR_NUMBER, cfg.SUMMARY_COMMENT_MARKER, body)
         print("PR automatically rejected: modifies root README.md")
         return 1
 
-    # Fetch diff
-    diff = gh.get_pr_diff(REPO, BASE_SHA, HEAD_SHA)
+    diff = _pr_diff()
 
     # Auto-reject PRs whose diff is too large to review safely
     if len(diff) > cfg.MAX_DIFF_CHARS:
@@ -182,17 +252,17 @@ async def cmd_vote() -> int:
             cfg.SUMMARY_COMMENT_MARKER,
             "## AgentLang Council Vote Summary",
             "",
-            f"**Result: ❌ AUTOMATICALLY REJECTED** — Diff exceeds {cfg.MAX_DIFF_CHARS:,} characters ({len(diff):,} chars).",
+            f"**Result: ❌ AUTOMATICALLY REJECTED** — Diff exceeds {cfg.MAX_DIFF_CHARS:,} characters.",
             "",
             "> Per governance rules, pull requests with diffs larger than this limit are automatically rejected.",
             "> Please split this PR into smaller, reviewable changes.",
         ])
-        gh.upsert_comment(REPO, PR_NUMBER, cfg.SUMMARY_COMMENT_MARKER, body)
-        print(f"PR automatically rejected: diff too large ({len(diff):,} chars > {cfg.MAX_DIFF_CHARS:,} limit)")
+        await gh.aupsert_comment(REPO, PR_NUMBER, cfg.SUMMARY_COMMENT_MARKER, body)
+        print(f"PR automatically rejected: diff too large (> {cfg.MAX_DIFF_CHARS:,} char limit)")
         return 1
 
     # Validation status for prompt context
-    val_results = validate_al_files(BASE_SHA, HEAD_SHA)
+    val_results = validate_al_files(BASE_SHA, HEAD_SHA, known_changed_paths=changed_files)
     validation_status = format_validation_status(val_results)
 
     system_prompts: dict[str, str] = {}
@@ -205,9 +275,12 @@ async def cmd_vote() -> int:
         validation_status=validation_status,
     )
 
-    # Split agents into active vs disabled
-    active_agents = [a for a in cfg.AGENTS if a["enabled"] and a.get("agent_class")]
+    # Split agents into active vs disabled. Enabled agents without an API key
+    # abstain up front, so their SDK is never imported and no prompt is built.
+    enabled_agents = [a for a in cfg.AGENTS if a["enabled"] and a.get("agent_class")]
     disabled_agents = [a for a in cfg.AGENTS if not a["enabled"]]
+    skipped = {a["id"]: _build_unconfigured_record(a) for a in enabled_agents if not _has_api_key(a)}
+    active_agents = [a for a in enabled_agents if a["id"] not in skipped]
 
     # Build system prompts for active agents
     for agent_cfg in active_agents:
@@ -221,25 +294,22 @@ async def cmd_vote() -> int:
         run_single_agent(agent_cfg, system_prompts[agent_cfg["id"]], user_prompt)
         for agent_cfg in active_agents
     ]
-    active_records: list[AgentVoteRecord] = await asyncio.gather(*tasks)
+    voted = dict(zip((a["id"] for a in active_agents), await asyncio.gather(*tasks)))
+    records_by_id = {**skipped, **voted}
+    active_records = [records_by_id[a["id"]] for a in enabled_agents]
 
     # Combine with disabled records (for display only)
     disabled_records = [_build_disabled_record(a) for a in disabled_agents]
     all_records = list(active_records) + disabled_records
 
-    # Post individual vote comments (active agents only)
-    for record in active_records:
-        marker = f"<!-- agentlang-vote-{record.agent_name.lower().replace(' ', '-')}-comment -->"
-        body = format_individual_vote_comment(record, PR_NUMBER)
-        try:
-            gh.upsert_comment(REPO, PR_NUMBER, marker, body)
-        except Exception as exc:
-            print(f"  Warning: could not post comment for {record.agent_name}: {exc}")
+    # Post individual vote comments (active agents only), sharing one comment listing
+    comments = await gh.aget_pr_comments(REPO, PR_NUMBER)
+    await asyncio.gather(*(_post_vote_comment(record, comments) for record in active_records))
 
     # Tally and post summary (active records only for the vote count)
     tally_result = tally(active_records, threshold)
     summary_body = format_summary_comment(all_records, tally_result)
-    gh.upsert_comment(REPO, PR_NUMBER, cfg.SUMMARY_COMMENT_MARKER, summary_body)
+    await gh.aupsert_comment(REPO, PR_NUMBER, cfg.SUMMARY_COMMENT_MARKER, summary_body, comments)
 
     print(f"\nVote result: {'APPROVED' if tally_result['approved'] else 'REJECTED'} "
           f"({tally_result['approvals']}✅ / {tally_result['rejections']}❌ / "
@@ -249,6 +319,14 @@ async def cmd_vote() -> int:
     return 0 if tally_result["approved"] else 1
 
 
+async def _run_vote() -> int:
+    """Run cmd_vote and release the pooled async GitHub client afterwards."""
+    try:
+        return await cmd_vote()
+    finally:
+        await gh.aclose()
+
+
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
 def main() -> int:
@@ -264,7 +342,7 @@ def main() -> int:
     elif args.flag_readme:
         return cmd_flag_readme()
     elif args.vote:
-        return asyncio.run(cmd_vote())
+        return asyncio.run(_run_vote())
     else:
         parser.print_help()
         return 1
@@ -4,6 +4,8 @@ Prompt templates for the AgentLang Language Council.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 SYSTEM_PROMPT_TEMPLATE = """\
 You are {agent_name}, an AI assistant made by {company}, serving as {company}'s \
 representative on the AgentLang Language Council.
@@ -75,6 +77,7 @@ Please review this pull request and cast your vote according to the governance r
 """
 
 
+@lru_cache(maxsize=32)
 def build_system_prompt(agent_name: str, company: str) -> str:
     return SYSTEM_PROMPT_TEMPLATE.format(agent_name=agent_name, company=company)
 
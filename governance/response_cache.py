@@ -0,0 +1,55 @@
+"""
+On-disk cache of raw LLM responses.
+CI re-runs of an unchanged PR reuse each agent's earlier answer instead of re-querying it.
+Entries are keyed by a SHA-256 of the full request, so any change to the model,
+prompts, or diff produces a new key — there is no explicit invalidation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from typing import Awaitable, Callable
+
+CACHE_DIR = os.environ.get("AGENTLANG_CACHE_DIR", ".agentlang_cache")
+
+
+def make_key(*parts: str) -> bytes:
+    """Join request parts unambiguously into key material for get_or_call."""
+    return b"\x00".join(p.encode("utf-8") for p in parts)
+
+
+def _path(key_material: bytes) -> str:
+    return os.path.join(CACHE_DIR, f"{hashlib.sha256(key_material).hexdigest()}.json")
+
+
+async def get_or_call(
+    key_material: bytes,
+    compute: Callable[[], Awaitable[str]],
+    model: str = "",
+) -> str:
+    """
+    Return the cached response for key_material, or await compute() and store it.
+    Exceptions from compute() propagate and nothing is cached.
+    """
+    path = _path(key_material)
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)["raw_response"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    raw = await compute()
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump({"raw_response": raw, "ts": time.time(), "model": model}, fh)
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        # A cache write failure must never cost us the vote
+        print(f"  Warning: could not write response cache {path}: {exc}")
+    return raw
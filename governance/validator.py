@@ -5,14 +5,12 @@ Rule: The first line must be non-empty and consist entirely of printable ASCII (
 
 from __future__ import annotations
 
-import re
 import subprocess
 from dataclasses import dataclass, field
+from typing import Iterator
 
-PRINTABLE_ASCII_RE = re.compile(r"^[ -~]+$")
 
-
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     file_path: str
     passed: bool
@@ -20,17 +18,18 @@ class ValidationResult:
 
 
 def validate_al_content(content: str, file_path: str) -> ValidationResult:
-    """Validate the content of a single .al file."""
-    lines = content.splitlines()
-    if not lines or not lines[0].strip():
+    """Validate the content of a single .al file (or just its first line)."""
+    # Only line 1 matters; don't split the rest of the file
+    first_line = content.split("\n", 1)[0].rstrip("\r")
+    if not first_line.strip():
         return ValidationResult(
             file_path=file_path,
             passed=False,
             error="First line is empty. .al files must declare their version on line 1 "
                   "(e.g. `AgentLang 0.1.0-alpha`).",
         )
-    first_line = lines[0]
-    if not PRINTABLE_ASCII_RE.match(first_line):
+    # isascii + isprintable is exactly U+0020–U+007E, checked in C without a regex
+    if not (first_line.isascii() and first_line.isprintable()):
         return ValidationResult(
             file_path=file_path,
             passed=False,
@@ -39,46 +38,122 @@ def validate_al_content(content: str, file_path: str) -> ValidationResult:
     return ValidationResult(file_path=file_path, passed=True)
 
 
-def get_changed_al_files(base_sha: str, head_sha: str) -> list[str]:
-    """Return list of .al files added or modified in the diff."""
+def get_changed_al_files(base_sha: str, head_sha: str) -> list[tuple[str, str]]:
+    """
+    Return (path, blob_oid) for each .al file added, modified, or renamed in the
+    diff (renamed files are reported under their new path, matching the GitHub
+    PR files API). The raw diff format carries the new blob's object id, so
+    contents can be read directly without resolving `<sha>:<path>` again.
+    """
+    # Raw bytes + a single decode per path beats text-mode pipe decoding;
+    # stderr is discarded so a chatty git can't stall on a full pipe.
     result = subprocess.run(
-        ["git", "diff", "--name-only", "--diff-filter=AM", base_sha, head_sha],
-        capture_output=True,
-        text=True,
+        ["git", "diff", "--raw", "--no-abbrev", "-M", "--diff-filter=AMR", "-z", base_sha, head_sha],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         check=True,
     )
-    return [f for f in result.stdout.splitlines() if f.endswith(".al")]
+    # -z output: ":<mode_src> <mode_dst> <oid_src> <oid_dst> <status>\0<path>\0" per file;
+    # renames (status R<score>) carry "<src_path>\0<dst_path>\0" instead
+    fields = iter(result.stdout.split(b"\0"))
+    changed: list[tuple[str, str]] = []
+    for header in fields:
+        if not header:
+            break
+        _, _, _, oid, status = header.split()
+        path = next(fields)
+        if status.startswith(b"R"):
+            path = next(fields)
+        if path.endswith(b".al"):
+            changed.append((path.decode("utf-8", errors="replace"), oid.decode("ascii")))
+    return changed
+
+
+def iter_blobs(object_specs: list[str]) -> Iterator[bytes | None]:
+    """
+    Read git objects (e.g. `<sha>:<path>`) through a single `git cat-file --batch`
+    process instead of one file open per path. Yields each object's content, or
+    None if it does not exist, as soon as it has been read.
+    """
+    if not object_specs:
+        return
+    proc = subprocess.Popen(
+        ["git", "cat-file", "--batch=%(objectname) %(objecttype) %(objectsize)"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    assert proc.stdin is not None and proc.stdout is not None
+    try:
+        for spec in object_specs:
+            proc.stdin.write(f"{spec}\n".encode("utf-8"))
+            proc.stdin.flush()
+            header = proc.stdout.readline().rstrip()
+            # "<spec> missing" (or ambiguous) instead of "<oid> <type> <size>";
+            # the spec itself may contain spaces, so only the suffix is reliable
+            if header.endswith((b" missing", b" ambiguous")):
+                yield None
+                continue
+            blob = proc.stdout.read(int(header.rsplit(b" ", 1)[1]))
+            proc.stdout.read(1)  # trailing newline after the object content
+            yield blob
+    finally:
+        proc.stdin.close()
+        proc.stdout.close()
+        proc.wait()
 
 
-def validate_al_files(base_sha: str, head_sha: str) -> list[ValidationResult]:
-    """Validate all .al files changed between base_sha and head_sha."""
-    al_files = get_changed_al_files(base_sha, head_sha)
+def _validate_blob(path: str, blob: bytes) -> ValidationResult:
+    # Only line 1 is validated, so only decode that much
+    first_line = blob.split(b"\n", 1)[0].decode("utf-8", errors="replace")
+    return validate_al_content(first_line, path)
+
+
+def validate_al_files(
+    base_sha: str,
+    head_sha: str,
+    known_changed_paths: list[str] | None = None,
+) -> list[ValidationResult]:
+    """
+    Validate all .al files changed between base_sha and head_sha, as of head_sha.
+    If the caller already has the PR's changed paths (e.g. from the GitHub API),
+    pass them as known_changed_paths: when none is a .al file, the `git diff`
+    subprocess is skipped. The files actually validated always come from the
+    local diff, since an API listing may reflect a newer head than head_sha.
+    """
+    if known_changed_paths is not None and not any(p.endswith(".al") for p in known_changed_paths):
+        return []
+    changed = get_changed_al_files(base_sha, head_sha)
+    if not changed:
+        return []
+    al_files = [path for path, _ in changed]
+    specs = [oid for _, oid in changed]
+
+    # Validation is a first-line check, far cheaper than the pipe round-trip, so
+    # each blob is checked inline as it arrives rather than handed to a pool.
     results: list[ValidationResult] = []
-    for path in al_files:
-        try:
-            with open(path, encoding="utf-8", errors="replace") as fh:
-                content = fh.read()
-            results.append(validate_al_content(content, path))
-        except FileNotFoundError:
-            # File was deleted — skip validation
-            pass
-        except Exception as exc:
-            results.append(ValidationResult(
-                file_path=path,
-                passed=False,
-                error=f"Could not read file: {exc}",
-            ))
+    read = 0
+    try:
+        for path, blob in zip(al_files, iter_blobs(specs)):
+            read += 1
+            if blob is None:
+                results.append(ValidationResult(
+                    file_path=path,
+                    passed=False,
+                    error=f"File not found at head commit {head_sha[:7]}.",
+                ))
+            else:
+                results.append(_validate_blob(path, blob))
+    except Exception as exc:
+        results.extend(
+            ValidationResult(file_path=path, passed=False, error=f"Could not read file: {exc}")
+            for path in al_files[read:]
+        )
     return results
 
 
 def format_validation_status(results: list[ValidationResult]) -> str:
     """Return a short human-readable validation summary for the vote prompt."""
-    if not results:
-        return "No .al files changed."
-    lines: list[str] = []
-    for r in results:
-        if r.passed:
-            lines.append(f"- `{r.file_path}`: VALID")
-        else:
-            lines.append(f"- `{r.file_path}`: INVALID — {r.error}")
-    return "\n".join(lines)
+    return "\n".join(
+        f"- `{r.file_path}`: VALID" if r.passed else f"- `{r.file_path}`: INVALID — {r.error}"
+        for r in results
+    ) or "No .al files changed."
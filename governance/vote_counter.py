@@ -4,10 +4,19 @@ Tallies agent votes and formats the council summary comment.
 
 from __future__ import annotations
 
+import io
+from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
-from config import APPROVAL_THRESHOLD, SUPERMAJORITY_THRESHOLD, MIN_VOTES, SUMMARY_COMMENT_MARKER
+from config import (
+    APPROVAL_THRESHOLD,
+    SUPERMAJORITY_THRESHOLD,
+    MIN_VOTES,
+    SUMMARY_COMMENT_MARKER,
+    VOTE_COMMENT_MARKER,
+)
 
 VoteValue = Literal["APPROVE", "REJECT", "ABSTAIN", "ERROR", "DISABLED"]
 
@@ -19,8 +28,31 @@ VOTE_EMOJI = {
     "DISABLED": "💤",
 }
 
-
-@dataclass
+# Fixed parts of the summary comment; only the rows and result vary per PR
+_SUMMARY_HEADER = (
+    f"{SUMMARY_COMMENT_MARKER}\n"
+    "## AgentLang Council Vote Summary\n"
+    "\n"
+    "| Agent | Company | Vote | Notes |\n"
+    "|-------|---------|------|-------|\n"
+)
+_SUMMARY_NO_RECORDS = (
+    f"{SUMMARY_COMMENT_MARKER}\n"
+    "## AgentLang Council Vote Summary\n"
+    "\n"
+    "**Result: NO VOTE** — no eligible votes cast"
+)
+_SUMMARY_FOOTER_SIMPLE = (
+    "\n_Votes cast by AI agents on the AgentLang Language Council. "
+    "Simple majority (>{}) of all votes determines outcome._"
+)
+_SUMMARY_FOOTER_SUPER = (
+    "\n_Votes cast by AI agents on the AgentLang Language Council. "
+    "Super-majority (>{}) of all votes determines outcome._"
+)
+
+
+@dataclass(slots=True)
 class AgentVoteRecord:
     agent_name: str
     company: str
@@ -29,6 +61,13 @@ class AgentVoteRecord:
     error: str = ""
 
 
+# Summary-table notes for the only votes that carry any; all others get ""
+_NOTES_BUILDERS = {
+    "ERROR": lambda r: f"_{r.error}_" if r.error else "_API error_",
+    "DISABLED": lambda r: r.error or "_Not yet enabled_",
+}
+
+
 def tally(records: list[AgentVoteRecord], threshold: float = APPROVAL_THRESHOLD) -> dict:
     """
     Compute the vote outcome.
@@ -38,11 +77,12 @@ def tally(records: list[AgentVoteRecord], threshold: float = APPROVAL_THRESHOLD)
     Pass threshold=SUPERMAJORITY_THRESHOLD for governance/workflow changes.
     Quorum (MIN_VOTES non-ERROR responses) must be met for the vote to be valid.
     """
-    approvals = sum(1 for r in records if r.vote == "APPROVE")
-    rejections = sum(1 for r in records if r.vote == "REJECT")
-    abstentions = sum(1 for r in records if r.vote == "ABSTAIN")
-    errors = sum(1 for r in records if r.vote == "ERROR")
-    disabled = sum(1 for r in records if r.vote == "DISABLED")
+    counts = Counter(r.vote for r in records)  # counting loop runs in C
+    approvals = counts["APPROVE"]
+    rejections = counts["REJECT"]
+    abstentions = counts["ABSTAIN"]
+    errors = counts["ERROR"]
+    disabled = counts["DISABLED"]
 
     eligible = approvals + rejections + abstentions + errors  # all participating agents; errors count as abstentions
     quorum_met = eligible >= MIN_VOTES
@@ -75,32 +115,33 @@ def format_summary_comment(
     tally_result: dict,
 ) -> str:
     """Build the markdown summary comment posted to GitHub."""
-    lines: list[str] = [
-        SUMMARY_COMMENT_MARKER,
-        "## AgentLang Council Vote Summary",
-        "",
-        "| Agent | Company | Vote | Notes |",
-        "|-------|---------|------|-------|",
-    ]
+    if not records:
+        return _SUMMARY_NO_RECORDS
+
+    emoji_get = VOTE_EMOJI.get
+    row = "| {} | {} | {} {} | {} |\n".format
+    buf = io.StringIO()
+    write = buf.write
+    notes_get = _NOTES_BUILDERS.get
 
     for r in records:
-        emoji = VOTE_EMOJI.get(r.vote, "❓")
-        vote_display = f"{emoji} {r.vote}"
-        notes = ""
-        if r.vote == "ERROR":
-            notes = f"_{r.error}_" if r.error else "_API error_"
-        elif r.vote == "DISABLED":
-            notes = r.error or "_Not yet enabled_"
-        lines.append(f"| {r.agent_name} | {r.company} | {vote_display} | {notes} |")
+        builder = notes_get(r.vote)
+        notes = builder(r) if builder else ""
+        write(row(r.agent_name, r.company, emoji_get(r.vote, "❓"), r.vote, notes))
 
-    lines.append("")
+    write("\n")
 
     t = tally_result
+    approvals = t["approvals"]
+    rejections = t["rejections"]
+    abstentions = t["abstentions"]
+    errors = t["errors"]
+    ratio = t["ratio"]
     threshold = t["threshold"]
     is_supermajority = threshold >= SUPERMAJORITY_THRESHOLD
-    ratio_pct = f"{t['ratio']:.0%}"
+    ratio_pct = f"{ratio:.0%}"
     required_pct = f"{threshold:.0%}"
-    counts = f"{t['approvals']} approve / {t['rejections']} reject / {t['abstentions']} abstain"
+    counts = f"{approvals} approve / {rejections} reject / {abstentions} abstain"
 
     if t["denominator"] == 0:
         result_line = "**Result: NO VOTE** — no eligible votes cast"
@@ -114,36 +155,34 @@ def format_summary_comment(
     else:
         result_line = f"**Result: ❌ REJECTED** ({counts}, {ratio_pct} ≤ {required_pct} required)"
 
-    lines.append(result_line)
+    write(f"{result_line}\n")
 
     if is_supermajority:
-        lines.append(
+        write(
             f"\n> 🔒 This PR modifies governance or workflow files — "
-            f"a super-majority (>{required_pct}) is required."
+            f"a super-majority (>{required_pct}) is required.\n"
         )
 
-    if t["errors"] > 0:
-        lines.append(
-            f"\n> ⚠️ {t['errors']} agent(s) encountered API errors and are counted as abstentions."
+    if errors > 0:
+        write(
+            f"\n> ⚠️ {errors} agent(s) encountered API errors and are counted as abstentions.\n"
         )
 
-    lines.append("")
-    vote_type = "Super-majority" if is_supermajority else "Simple majority"
-    lines.append(
-        f"_Votes cast by AI agents on the AgentLang Language Council. "
-        f"{vote_type} (>{required_pct}) of all votes determines outcome._"
-    )
+    footer = _SUMMARY_FOOTER_SUPER if is_supermajority else _SUMMARY_FOOTER_SIMPLE
+    return _SUMMARY_HEADER + buf.getvalue() + footer.format(required_pct)
 
-    return "\n".join(lines)
+
+@lru_cache(maxsize=64)
+def vote_comment_marker(agent_name: str) -> str:
+    """Hidden marker identifying an agent's individual vote comment."""
+    return f"<!-- agentlang-vote-{agent_name.lower().replace(' ', '-')}-comment -->"
 
 
 def format_individual_vote_comment(record: AgentVoteRecord, pr_number: int) -> str:
     """Format a single agent's vote comment body."""
-    from config import VOTE_COMMENT_MARKER
-
     emoji = VOTE_EMOJI.get(record.vote, "❓")
     lines = [
-        f"<!-- agentlang-vote-{record.agent_name.lower().replace(' ', '-')}-comment -->",
+        vote_comment_marker(record.agent_name),
         VOTE_COMMENT_MARKER,
         f"### {emoji} {record.agent_name} ({record.company}) — {record.vote}",
         "",